@@ -26,6 +26,14 @@ RETRY_BACKOFF = 2
 REQUEST_TIMEOUT = 30
 RATE_LIMIT_DELAY = 1  # seconds between requests
 
+# On-disk HTTP cache (used when requests-cache is installed); 0 disables it
+HTTP_CACHE_PATH = os.getenv('HTTP_CACHE_PATH', 'http_cache')  # per-country files: http_cache_<iso3>.sqlite
+HTTP_CACHE_EXPIRE = int(os.getenv('HTTP_CACHE_EXPIRE', 86400))  # seconds
+
+# Bulk loading: COPY through a staging table, or multi-row INSERT ... VALUES pages when disabled
+DB_BULK_COPY = os.getenv('DB_BULK_COPY', '1') != '0'
+DB_INSERT_PAGE_SIZE = int(os.getenv('DB_INSERT_PAGE_SIZE', 1000))  # rows per VALUES statement
+
 # Data quality settings
 MIN_SIMILARITY_THRESHOLD = 90  # for deduplication
 MAX_RECORDS_PER_SOURCE = 10000  # prevent runaway extractions
@@ -13,6 +13,16 @@ class ExtractionMonitor:
     def __init__(self):
         self.conn = psycopg2.connect(**DB_PARAMS)
         self.cur = self.conn.cursor()
+        self._count_prepared = False
+    
+    def count_institutions(self, country):
+        """Number of institutions currently stored for a country"""
+        if not self._count_prepared:
+            # Planned once per session on first use; run before and after every extraction
+            self.cur.execute("PREPARE inst_count(text) AS SELECT COUNT(*) FROM institutions WHERE country = $1")
+            self._count_prepared = True
+        self.cur.execute("EXECUTE inst_count(%s)", (country,))
+        return self.cur.fetchone()[0]
     
     def generate_extraction_report(self, countries=None):
         """Generate comprehensive extraction report"""
@@ -1,24 +1,201 @@
 import logging
 import psycopg2
+from psycopg2.extras import execute_values
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 import time
-from fuzzywuzzy import fuzz
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+import numpy as np
+from rapidfuzz import fuzz, process, utils
 from datetime import datetime, timedelta
 import json
+from io import BytesIO
 import bs4 as BeautifulSoup
-import tempfile
 import pdfplumber
 import re
-from config import DB_PARAMS, InstitutionType
+import sqlite3
+import struct
+from dataclasses import dataclass, field, asdict
+from config import (DB_PARAMS, DB_BULK_COPY, DB_INSERT_PAGE_SIZE, InstitutionType,
+                    HTTP_CACHE_PATH, HTTP_CACHE_EXPIRE, MIN_SIMILARITY_THRESHOLD)
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # optional: every run downloads the sources afresh
+    requests_cache = None
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # optional: dedup compares every pair with cdist
+    MinHash = MinHashLSH = None
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+HTTP_POOL_SIZE = 10  # connections kept alive per host
+DEDUP_BLOCK_SIZE = 1000  # rows scored per cdist call, bounds the score matrix to BLOCK x N bytes
+# Above this many rows (and with datasketch installed) dedup only scores MinHash-LSH candidate pairs
+DEDUP_LSH_MIN_ROWS = 20000
+DEDUP_LSH_PERMUTATIONS = 128
+DEDUP_LSH_BANDS = (32, 4)  # bands x rows per band; candidate pairs from Jaccard ~0.4
+
+@dataclass(slots=True)
+class InstitutionRecord:
+    """A single extracted institution.
+
+    Slotted to keep per-row memory low on large feeds; supports the dict-style
+    access (get / [] / []=) that normalize() and insert_to_db() rely on.
+    """
+    name: str
+    type: InstitutionType
+    state: str = None
+    city: str = None
+    address: str = None
+    website: str = None
+    latitude: float = None
+    longitude: float = None
+    additional_attributes: dict = field(default_factory=dict)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def to_dict(self):
+        return asdict(self)
+
+# Columns loaded by insert_to_db, in COPY order
+_COPY_COLUMNS = (
+    'name', 'type', 'country', 'state', 'city', 'address', 'website',
+    'latitude', 'longitude', 'additional_attributes', 'last_updated'
+)
+
+# PostgreSQL binary COPY framing: signature, flags, header-extension length ... tuples ... -1
+_COPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_COPY_BINARY_TRAILER = struct.pack('>h', -1)
+_COPY_NULL = struct.pack('>i', -1)
+_PG_EPOCH = datetime(2000, 1, 1)
+
+def _binary_text(value):
+    data = str(value).encode('utf-8')
+    return struct.pack('>i', len(data)) + data
+
+def _binary_float8(value):
+    return struct.pack('>id', 8, value)
+
+def _binary_jsonb(value):
+    data = value.encode('utf-8')
+    return struct.pack('>ib', len(data) + 1, 1) + data  # jsonb wire version 1, then the JSON text
+
+def _binary_timestamp(value):
+    delta = value - _PG_EPOCH
+    return struct.pack('>iq', 8, (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+# Binary encoder per _COPY_COLUMNS entry; enum labels travel as text
+_COPY_ENCODERS = (
+    _binary_text, _binary_text, _binary_text, _binary_text, _binary_text, _binary_text, _binary_text,
+    _binary_float8, _binary_float8, _binary_jsonb, _binary_timestamp
+)
+_COPY_FIELD_COUNT = struct.pack('>h', len(_COPY_COLUMNS))
+
+def _copy_binary_row(row):
+    """Encode one tuple for COPY ... WITH BINARY: field count, then length-prefixed values"""
+    return _COPY_FIELD_COUNT + b''.join(
+        _COPY_NULL if value is None else encode(value)
+        for encode, value in zip(_COPY_ENCODERS, row)
+    )
+
+def _float_or_none(value):
+    """Coordinate as a float; raises ValueError for unparseable values so the record is skipped"""
+    return None if value is None else float(value)
+
+def _dumps_json(value):
+    """Encode additional_attributes as JSON text, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(value)
+
+class _CopyStream:
+    """Read-only file-like adapter that feeds copy_expert from an iterator of byte chunks"""
+
+    def __init__(self, lines):
+        self._lines = lines
+        self._pending = b''
+
+    def read(self, size=-1):
+        parts = [self._pending]
+        length = len(self._pending)
+        for line in self._lines:
+            parts.append(line)
+            length += len(line)
+            if 0 <= size <= length:
+                break
+        data = b''.join(parts)
+        if size < 0:
+            self._pending = b''
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+def _close_response(future):
+    """Release the connection held by a finished get_with_retry future"""
+    if not future.cancelled() and future.exception() is None and future.result() is not None:
+        future.result().close()
+
 class BaseExtractor:
     def __init__(self, country):
         self.country = country.upper()  # Ensure ISO3 uppercase
         self.conn = psycopg2.connect(**DB_PARAMS)
+        self.conn.set_client_encoding('UTF8')  # binary COPY sends text fields UTF-8 encoded
         self.cur = self.conn.cursor()
+        self.session = self._create_session()
+        # requests-cache reads every body in full before caching it, which would defeat
+        # streamed reads; those go through an uncached session of their own
+        self.stream_session = (self._create_session(cached=False)
+                               if requests_cache is not None and isinstance(self.session, requests_cache.CachedSession)
+                               else self.session)
+
+    def _create_session(self, cached=True):
+        """Shared HTTP session so requests to the same host reuse pooled connections.
+
+        With requests-cache installed, responses are kept in a SQLite cache and
+        revalidated with ETag/Last-Modified, so unchanged sources aren't re-downloaded.
+        Each country gets its own cache file, since countries extract in parallel
+        processes and SQLite allows only one writer at a time.
+        """
+        if cached and requests_cache is not None and HTTP_CACHE_EXPIRE > 0:
+            session = requests_cache.CachedSession(
+                f"{HTTP_CACHE_PATH}_{self.country.lower()}",
+                backend='sqlite',
+                expire_after=HTTP_CACHE_EXPIRE,
+                cache_control=True,
+                allowable_codes=(200,),
+                stale_if_error=True
+            )
+        else:
+            session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'User-Agent': USER_AGENT})
+        return session
 
     def fetch_data(self):
         raise NotImplementedError("Subclasses must implement fetch_data")
@@ -27,47 +204,141 @@ class BaseExtractor:
         return data  # Subclasses can override for custom cleaning
 
     def deduplicate(self):
-        self.cur.execute("SELECT id, name, address FROM institutions WHERE country = %s", (self.country,))
+        self.cur.execute("SELECT id, name, address FROM institutions WHERE country = %s ORDER BY id", (self.country,))
         existing = self.cur.fetchall()
-        existing_dict = {row[0]: {'name': row[1], 'address': row[2] or ''} for row in existing}
-        duplicates = []
-        for id1, info1 in existing_dict.items():
-            for id2, info2 in existing_dict.items():
-                if id1 < id2 and fuzz.token_sort_ratio(info1['name'] + info1['address'], info2['name'] + info2['address']) > 90:
-                    duplicates.append(id2)  # Keep lower ID
+        ids = [row[0] for row in existing]
+        # Lower-case/strip/de-punctuate each key once, not on every comparison
+        keys = [utils.default_process(row[1] + (row[2] or '')) for row in existing]
+        ids, keys, duplicates = self._exact_duplicates(ids, keys)
+        if MinHashLSH is not None and len(keys) >= DEDUP_LSH_MIN_ROWS:
+            duplicates |= self._lsh_duplicates(ids, keys)
+        else:
+            duplicates |= self._cdist_duplicates(ids, keys)
         if duplicates:
-            logger.info(f"Found {len(set(duplicates))} duplicates in {self.country}. Removing...")
-            self.cur.execute("DELETE FROM institutions WHERE id = ANY(%s)", (list(set(duplicates)),))
+            logger.info(f"Found {len(duplicates)} duplicates in {self.country}. Removing...")
+            self.cur.execute("DELETE FROM institutions WHERE id = ANY(%s)", (list(duplicates),))
             self.conn.commit()
 
-    def insert_to_db(self, data):
-        inserted_count = 0
+    def _exact_duplicates(self, ids, keys):
+        """O(N) pass over identical keys, which the fuzzy scorer would rate 100 anyway.
+
+        Returns the ids and keys of the first row per key (for the fuzzy pass) and the
+        ids of the later repeats.
+        """
+        first = {}
+        duplicates = set()
+        for row_id, key in zip(ids, keys):
+            if key in first:
+                duplicates.add(row_id)
+            else:
+                first[key] = row_id
+        return list(first.values()), list(first), duplicates
+
+    def _cdist_duplicates(self, ids, keys):
+        """Exhaustive pairwise scoring of processed keys; returns the higher ids of near-duplicate pairs"""
+        duplicates = set()
+        # Score blocks of rows against all rows in parallel C++; uint8 rounds like fuzzywuzzy's integer scores
+        for start in range(0, len(keys), DEDUP_BLOCK_SIZE):
+            scores = process.cdist(
+                keys[start:start + DEDUP_BLOCK_SIZE], keys,
+                scorer=fuzz.token_sort_ratio, processor=None,
+                dtype=np.uint8, workers=-1
+            )
+            # Only pairs with a higher id on the right, so the lower ID is kept
+            _, cols = np.nonzero(np.triu(scores > MIN_SIMILARITY_THRESHOLD, k=start + 1))
+            duplicates.update(ids[col] for col in cols)
+        return duplicates
+
+    def _lsh_duplicates(self, ids, keys):
+        """Approximate pairing for large tables: MinHash-LSH over character 3-grams
+        proposes candidate pairs, and only those are verified with the fuzzy scorer."""
+        # Shingle the token-sorted form, matching what token_sort_ratio compares
+        sorted_keys = [' '.join(sorted(key.split())) for key in keys]
+        shingles = [{key[i:i + 3].encode() for i in range(max(len(key) - 2, 1))} for key in sorted_keys]
+        minhashes = MinHash.bulk(shingles, num_perm=DEDUP_LSH_PERMUTATIONS)
+        lsh = MinHashLSH(num_perm=DEDUP_LSH_PERMUTATIONS, params=DEDUP_LSH_BANDS)
+        for index, minhash in enumerate(minhashes):
+            lsh.insert(index, minhash)
+        duplicates = set()
+        for index, minhash in enumerate(minhashes):
+            for other in lsh.query(minhash):
+                if other > index and round(fuzz.token_sort_ratio(keys[index], keys[other], processor=None)) > MIN_SIMILARITY_THRESHOLD:
+                    duplicates.add(ids[other])
+        return duplicates
+
+    def _rows(self, data, now):
+        """Yield one column tuple per record, in _COPY_COLUMNS order; unserializable records
+        (including unparseable coordinates) are logged and skipped, for both load paths"""
         for item in data:
             try:
-                additional = json.dumps(item.get('additional_attributes', {}))
-                self.cur.execute("""
-                    INSERT INTO institutions (name, type, country, state, city, address, website, latitude, longitude, additional_attributes, last_updated)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT DO NOTHING
-                """, (
+                inst_type = item.get('type')
+                row = (
                     item.get('name'), 
-                    item.get('type').value if hasattr(item.get('type'), 'value') else item.get('type'), 
+                    inst_type.value if hasattr(inst_type, 'value') else inst_type, 
                     self.country, 
                     item.get('state'), 
                     item.get('city'),
                     item.get('address'), 
                     item.get('website'), 
-                    item.get('latitude'), 
-                    item.get('longitude'),
-                    additional, 
-                    datetime.now()
-                ))
-                inserted_count += 1
+                    _float_or_none(item.get('latitude')), 
+                    _float_or_none(item.get('longitude')),
+                    _dumps_json(item.get('additional_attributes', {})), 
+                    now
+                )
             except Exception as e:
-                logger.error(f"Error inserting record {item.get('name', 'Unknown')}: {e}")
+                logger.error(f"Error serializing record {item.get('name', 'Unknown')}: {e}")
                 continue
+            yield row
+
+    def _copy_chunks(self, data, now):
+        """Serialize records lazily into binary COPY format, header and trailer included"""
+        yield _COPY_BINARY_HEADER
+        for row in self._rows(data, now):
+            yield _copy_binary_row(row)
+        yield _COPY_BINARY_TRAILER
+
+    def insert_to_db(self, data):
+        """Bulk-load records: COPY into a temporary staging table, then one INSERT ... SELECT.
+
+        With DB_BULK_COPY off (e.g. behind a pooler that doesn't pass COPY through),
+        rows go out as multi-row INSERT ... VALUES statements instead.
+        """
+        now = datetime.now()
+        columns = ', '.join(_COPY_COLUMNS)
+        try:
+            # The load is re-runnable, so don't wait on the WAL flush at commit; a crash can
+            # lose the last few commits but never leaves the table inconsistent
+            self.cur.execute("SET LOCAL synchronous_commit = off")
+            if DB_BULK_COPY:
+                # Rows are serialized as COPY pulls them, so no second copy of the data is built;
+                # binary format sends coordinates and timestamps without server-side text parsing.
+                # The staging table is TEMP: session-private (safe for parallel countries) and never WAL-logged
+                stream = _CopyStream(self._copy_chunks(data, now))
+                self.cur.execute(f"""
+                    CREATE TEMP TABLE institutions_staging ON COMMIT DROP AS
+                    SELECT {columns} FROM institutions WITH NO DATA
+                """)
+                self.cur.copy_expert(f"COPY institutions_staging ({columns}) FROM STDIN WITH BINARY", stream)
+                self.cur.execute(f"""
+                    INSERT INTO institutions ({columns})
+                    SELECT {columns} FROM institutions_staging
+                    ON CONFLICT DO NOTHING
+                """)
+                inserted_count = self.cur.rowcount
+            else:
+                # One round trip per page of rows; RETURNING counts rows across every page
+                inserted = execute_values(self.cur, f"""
+                    INSERT INTO institutions ({columns}) VALUES %s
+                    ON CONFLICT DO NOTHING
+                    RETURNING id
+                """, self._rows(data, now), page_size=DB_INSERT_PAGE_SIZE, fetch=True)
+                inserted_count = len(inserted)
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error bulk-loading records for {self.country}: {e}")
+            raise
         
-        self.conn.commit()
         logger.info(f"Inserted/updated {inserted_count} records for {self.country}")
 
     def needs_refresh(self, days=30):
@@ -97,21 +368,32 @@ class BaseExtractor:
             self.close()
 
     def close(self):
+        if self.stream_session is not self.session:
+            self.stream_session.close()
+        if self.session:
+            self.session.close()
         if self.cur:
             self.cur.close()
         if self.conn:
             self.conn.close()
 
-    def get_with_retry(self, url, retries=3, backoff_factor=1, timeout=30):
-        """Enhanced retry mechanism with better error handling"""
+    def get_with_retry(self, url, retries=3, backoff_factor=1, timeout=30, stream=False):
+        """Enhanced retry mechanism with better error handling.
+
+        With stream=True the body is not read up front (and bypasses the HTTP cache);
+        callers consume response.raw (or iter_content) and should close the response.
+        """
         backoff = backoff_factor
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        session = self.stream_session if stream else self.session
         
         for attempt in range(retries):
             try:
-                response = requests.get(url, timeout=timeout, headers=headers)
+                try:
+                    response = session.get(url, timeout=timeout, stream=stream)
+                except sqlite3.OperationalError as e:
+                    # Cache file busy (e.g. another run holds the lock); fetch uncached instead
+                    logger.warning(f"HTTP cache unavailable for {url}: {e}. Fetching without cache.")
+                    response = self.stream_session.get(url, timeout=timeout, stream=stream)
                 response.raise_for_status()
                 return response
             except RequestException as e:
@@ -123,6 +405,33 @@ class BaseExtractor:
         logger.error(f"Failed to fetch {url} after {retries} retries.")
         return None
 
+    def fetch_concurrently(self, fetchers):
+        """Run independent source fetchers on a thread pool, concatenating their records in order.
+
+        Fetchers are network-bound and catch their own errors, returning a list
+        (or None); threads overlap their HTTP waits on the shared session.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(len(fetchers), HTTP_POOL_SIZE))) as executor:
+            futures = [executor.submit(fetcher) for fetcher in fetchers]
+            return list(chain.from_iterable(future.result() or [] for future in futures))
+
+    def iter_responses(self, urls, **kwargs):
+        """Request all candidate URLs concurrently, yielding (url, response) in the given order.
+
+        Lets callers keep their preference order while paying for the slowest
+        live candidate instead of the sum of every timeout. Requests still in
+        flight when the caller stops iterating are cancelled or closed.
+        """
+        executor = ThreadPoolExecutor(max_workers=max(1, min(len(urls), HTTP_POOL_SIZE)))
+        futures = [executor.submit(self.get_with_retry, url, **kwargs) for url in urls]
+        try:
+            for url, future in zip(urls, futures):
+                yield url, future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            for future in futures:
+                future.add_done_callback(_close_response)
+
     def fetch_paginated_scrape(self, base_url, page_param='page', start_page=1, max_pages=10, parser=None):
         data = []
         for page in range(start_page, start_page + max_pages):
@@ -132,7 +441,7 @@ class BaseExtractor:
                 break
             
             try:
-                soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+                soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
                 page_data = parser(soup) if parser else []
                 if not page_data:
                     logger.info(f"No data found on page {page}, stopping pagination")
@@ -154,7 +463,7 @@ class BaseExtractor:
             if not response:
                 return []
             
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             
             # Look for PDF download link
             pdf_link = None
@@ -172,40 +481,39 @@ class BaseExtractor:
             if not pdf_response:
                 return []
             
-            with tempfile.NamedTemporaryFile(suffix='.pdf') as tmp:
-                tmp.write(pdf_response.content)
-                with pdfplumber.open(tmp.name) as pdf:
-                    data = []
-                    for page in pdf.pages:
-                        tables = page.extract_tables()
-                        for table in tables:
-                            if not table:
+            # pdfplumber reads file-like objects, so parse straight from memory
+            with pdfplumber.open(BytesIO(pdf_response.content)) as pdf:
+                data = []
+                for page in pdf.pages:
+                    tables = page.extract_tables()
+                    for table in tables:
+                        if not table:
+                            continue
+                        for row in table[1:]:  # Skip header
+                            if not row or len(row) < 2:
                                 continue
-                            for row in table[1:]:  # Skip header
-                                if not row or len(row) < 2:
-                                    continue
+                            
+                            if country_filter in str(row[0]):
+                                name = row[1] if len(row) > 1 else row[0]
+                                address = row[2] if len(row) > 2 else ''
                                 
-                                if country_filter in str(row[0]):
-                                    name = row[1] if len(row) > 1 else row[0]
-                                    address = row[2] if len(row) > 2 else ''
-                                    
-                                    # Parse city and state from address
-                                    city_state = address.split(',')[-2:] if address else ['', '']
-                                    city = city_state[0].strip() if len(city_state) > 1 else None
-                                    state = city_state[1].strip() if len(city_state) > 1 else None
-                                    
-                                    data.append({
-                                        'name': name,
-                                        'city': city,
-                                        'state': state,
-                                        'address': address,
-                                        'type': InstitutionType.VETERINARY_SCHOOL,
-                                        'additional_attributes': {
-                                            'accreditation': row[3] if len(row) > 3 else 'AVMA',
-                                            'source': 'AVMA'
-                                        }
-                                    })
-            
+                                # Parse city and state from address
+                                city_state = address.split(',')[-2:] if address else ['', '']
+                                city = city_state[0].strip() if len(city_state) > 1 else None
+                                state = city_state[1].strip() if len(city_state) > 1 else None
+                                
+                                data.append(InstitutionRecord(
+                                    name=name,
+                                    city=city,
+                                    state=state,
+                                    address=address,
+                                    type=InstitutionType.VETERINARY_SCHOOL,
+                                    additional_attributes={
+                                        'accreditation': row[3] if len(row) > 3 else 'AVMA',
+                                        'source': 'AVMA'
+                                    }
+                                ))
+        
             logger.info(f"Fetched {len(data)} vet schools from AVMA for {country_filter}")
             return data
             
@@ -1,10 +1,8 @@
 import logging
 import requests
 import pandas as pd
-from io import StringIO
+from io import BytesIO
 import bs4 as BeautifulSoup
-import pdfplumber
-import tempfile
 import re
 from config import InstitutionType
 from extractors.base import BaseExtractor
@@ -16,13 +14,14 @@ class CANExtractor(BaseExtractor):
         super().__init__('CAN')
 
     def fetch_data(self):
-        all_data = []
-        all_data += self.fetch_vet_cvma() or []
-        all_data += self.fetch_avma_vet('Canada') or []
-        all_data += self.fetch_med_cacms() or []
-        all_data += self.fetch_med_wiki() or []
-        all_data += self.fetch_health_odhf() or []
-        all_data += self.fetch_research_hospitals() or []
+        all_data = self.fetch_concurrently((
+            self.fetch_vet_cvma,
+            lambda: self.fetch_avma_vet('Canada'),
+            self.fetch_med_cacms,
+            self.fetch_med_wiki,
+            self.fetch_health_odhf,
+            self.fetch_research_hospitals,
+        ))
         logger.info(f"Fetched {len(all_data)} raw records from all sources for Canada")
         return all_data
 
@@ -32,7 +31,7 @@ class CANExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             colleges_section = soup.find('div', class_='entry-content')
             if colleges_section:
@@ -56,7 +55,7 @@ class CANExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             for item in soup.find_all('div', class_='program-item'):
                 name_elem = item.find('h3')
@@ -83,7 +82,7 @@ class CANExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             table = soup.find('table', class_='wikitable')
             data = []
             if table:
@@ -115,7 +114,7 @@ class CANExtractor(BaseExtractor):
             response = self.get_with_retry(csv_url)
             if not response:
                 return []
-            df = pd.read_csv(StringIO(response.text))
+            df = pd.read_csv(BytesIO(response.content))
             data = []
             for _, row in df.iterrows():
                 facility_type = row.get('odhf_facility_type', '').lower()
@@ -161,7 +160,7 @@ class CANExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             table = soup.find('table')
             data = []
             if table:
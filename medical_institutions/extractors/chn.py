@@ -3,8 +3,6 @@ import requests
 import pandas as pd
 from io import StringIO
 import bs4 as BeautifulSoup
-import pdfplumber
-import tempfile
 import re
 from config import InstitutionType
 from extractors.base import BaseExtractor
@@ -16,15 +14,16 @@ class CHNExtractor(BaseExtractor):
         super().__init__('CHN')
 
     def fetch_data(self):
-        all_data = []
-        all_data += self.fetch_avma_vet('China') or []
-        all_data += self.fetch_vet_wiki() or []
-        all_data += self.fetch_med_wiki() or []
-        all_data += self.fetch_med_wdoms() or []
-        all_data += self.fetch_med_wcame() or []
-        all_data += self.fetch_hospitals_wiki() or []
-        all_data += self.fetch_hospitals_nhc() or []
-        all_data += self.fetch_hospitals_csds() or []
+        all_data = self.fetch_concurrently((
+            lambda: self.fetch_avma_vet('China'),
+            self.fetch_vet_wiki,
+            self.fetch_med_wiki,
+            self.fetch_med_wdoms,
+            self.fetch_med_wcame,
+            self.fetch_hospitals_wiki,
+            self.fetch_hospitals_nhc,
+            self.fetch_hospitals_csds,
+        ))
         logger.info(f"Fetched {len(all_data)} raw records from all sources for China")
         return all_data
 
@@ -34,7 +33,7 @@ class CHNExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             section = soup.find('span', id='China')
             data = []
             if section:
@@ -64,7 +63,7 @@ class CHNExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             tables = soup.find_all('table', class_='wikitable')
             data = []
             for table in tables:
@@ -121,7 +120,7 @@ class CHNExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             table = soup.find('table')
             data = []
             if table:
@@ -150,7 +149,7 @@ class CHNExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             current_province = None
             
@@ -186,7 +185,7 @@ class CHNExtractor(BaseExtractor):
             if not response:
                 return []
             
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             
             # Look for hospital listings - this would need to be adapted to actual site structure
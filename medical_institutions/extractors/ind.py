@@ -15,15 +15,16 @@ class INDExtractor(BaseExtractor):
         super().__init__('IND')
 
     def fetch_data(self):
-        all_data = []
-        all_data += self.fetch_med_nmc() or []
-        all_data += self.fetch_vet_vci() or []
-        all_data += self.fetch_hospitals_cghs() or []
-        all_data += self.fetch_hospitals_nhp() or []
-        all_data += self.fetch_aiims() or []
-        all_data += self.fetch_hospitals_wiki() or []
-        all_data += self.fetch_med_wiki() or []
-        all_data += self.fetch_vet_wiki() or []
+        all_data = self.fetch_concurrently((
+            self.fetch_med_nmc,
+            self.fetch_vet_vci,
+            self.fetch_hospitals_cghs,
+            self.fetch_hospitals_nhp,
+            self.fetch_aiims,
+            self.fetch_hospitals_wiki,
+            self.fetch_med_wiki,
+            self.fetch_vet_wiki,
+        ))
         logger.info(f"Fetched {len(all_data)} raw records from all sources for India")
         return all_data
 
@@ -74,7 +75,7 @@ class INDExtractor(BaseExtractor):
             if not response:
                 return []
             
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             
             # Look for college listings in tables or lists
@@ -113,7 +114,7 @@ class INDExtractor(BaseExtractor):
             if not response:
                 return []
             
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             
             # Look for state-wise listings
@@ -148,7 +149,7 @@ class INDExtractor(BaseExtractor):
             if not response:
                 return []
             
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             
             # Look for hospital listings
@@ -181,25 +182,28 @@ class INDExtractor(BaseExtractor):
             if not response:
                 return []
             
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             
-            # Look for hospital directories or state-wise links
-            for link in soup.find_all('a', href=True):
-                if 'hospital' in link.get('href', '').lower():
-                    state_response = self.get_with_retry(f"https://www.nhp.gov.in{link['href']}")
-                    if state_response:
-                        state_soup = BeautifulSoup.BeautifulSoup(state_response.text, 'lxml')
-                        
-                        # Extract hospital information from the state page
-                        for hospital_link in state_soup.find_all('a'):
-                            hospital_text = hospital_link.text.strip()
-                            if 'hospital' in hospital_text.lower():
-                                data.append({
-                                    'name': hospital_text,
-                                    'type': InstitutionType.HOSPITAL,
-                                    'additional_attributes': {'source': 'NHP'}
-                                })
+            # Look for hospital directories or state-wise links, and fetch them concurrently
+            state_urls = [
+                f"https://www.nhp.gov.in{link['href']}"
+                for link in soup.find_all('a', href=True)
+                if 'hospital' in link.get('href', '').lower()
+            ]
+            for _, state_response in self.iter_responses(state_urls):
+                if state_response:
+                    state_soup = BeautifulSoup.BeautifulSoup(state_response.content, 'lxml')
+                    
+                    # Extract hospital information from the state page
+                    for hospital_link in state_soup.find_all('a'):
+                        hospital_text = hospital_link.text.strip()
+                        if 'hospital' in hospital_text.lower():
+                            data.append({
+                                'name': hospital_text,
+                                'type': InstitutionType.HOSPITAL,
+                                'additional_attributes': {'source': 'NHP'}
+                            })
             
             logger.info(f"Fetched {len(data)} hospitals from NHP")
             return data
@@ -262,7 +266,7 @@ class INDExtractor(BaseExtractor):
             if not response:
                 return []
             
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             current_state = None
             
@@ -300,7 +304,7 @@ class INDExtractor(BaseExtractor):
             if not response:
                 return []
             
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             
             # Look for tables with medical college information
@@ -348,7 +352,7 @@ class INDExtractor(BaseExtractor):
             if not response:
                 return []
             
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup.BeautifulSoup(response.content, 'lxml')
             data = []
             
             # Find the India section
@@ -1,29 +1,279 @@
+import csv
 import logging
 import requests
 import pandas as pd
-from io import StringIO
-import bs4 as BeautifulSoup
-import pdfplumber
-import tempfile
+from io import BytesIO
+from lxml import etree, html
+import pymupdf
 import re
+import sys
+from dataclasses import replace
 from config import InstitutionType
-from extractors.base import BaseExtractor
+from extractors.base import BaseExtractor, InstitutionRecord
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib parser
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:  # optional: falls back to a multiline re scan
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
+# Pages with fewer text characters than this (and at least one image) are
+# treated as scanned and not worth extracting
+_MIN_PAGE_CHARS = 20
+
+def _parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+_LINE_Y_TOLERANCE = 3  # points; words whose tops are this close share a line (pdfplumber's default)
+
+def _page_text(page):
+    """Page text with one line per visual row, words joined by single spaces.
+
+    MuPDF's plain-text mode emits each text block on its own line, which splits table
+    columns (name / state / URL) apart; rebuilding rows from word positions keeps them
+    together the way pdfplumber's extract_text() did.
+    """
+    lines = []
+    line, line_top = [], None
+    for x0, y0, _, _, word, *_ in sorted(page.get_text('words'), key=lambda w: (w[1], w[0])):
+        if line_top is not None and y0 - line_top > _LINE_Y_TOLERANCE:
+            lines.append(' '.join(text for _, text in sorted(line)))
+            line = []
+        if not line:
+            line_top = y0
+        line.append((x0, word))
+    if line:
+        lines.append(' '.join(text for _, text in sorted(line)))
+    return '\n'.join(lines)
+
+def _pdf_page_texts(content):
+    """Extract the text of every page of a PDF payload, in page order, dropping scanned pages"""
+    texts = []
+    with pymupdf.open(stream=content, filetype='pdf') as pdf:
+        for page in pdf:
+            page_text = _page_text(page)
+            # Scanned pages carry images but no text layer; skip them
+            if len(page_text) < _MIN_PAGE_CHARS and page.get_images():
+                continue
+            texts.append(page_text)
+    return texts
+
+_AACOM_LINE_PATTERN = r'^[A-Z].+ [A-Z]{2} https?://'
+# Whole-line matcher for scanning the full document text in one pass
+_AACOM_LINE_RE = re.compile(_AACOM_LINE_PATTERN + r'.*$', re.MULTILINE)
+_AACOM_SPLIT_RE = re.compile(r' (\w{2}) (https?://\S+)')
+
+def _compile_aacom_db():
+    db = hyperscan.Database()
+    db.compile(expressions=[_AACOM_LINE_PATTERN.encode()], flags=[hyperscan.HS_FLAG_MULTILINE])
+    return db
+
+_AACOM_HS_DB = _compile_aacom_db() if hyperscan is not None else None
+
+def _aacom_school_lines(text):
+    """Return the lines of the AACOM directory text that look like school entries"""
+    if _AACOM_HS_DB is None:
+        return _AACOM_LINE_RE.findall(text)
+
+    # One scan over the whole document; Hyperscan reports match end offsets,
+    # which are mapped back to the start of their line
+    buf = text.encode()
+    starts = []
+
+    def on_match(_id, _from, to, _flags, _context):
+        start = buf.rfind(b'\n', 0, to) + 1
+        if not starts or starts[-1] != start:
+            starts.append(start)
+
+    _AACOM_HS_DB.scan(buf, match_event_handler=on_match)
+    lines = []
+    for start in starts:
+        end = buf.find(b'\n', start)
+        lines.append(buf[start:end if end != -1 else len(buf)].decode())
+    return lines
+
+# Compiled once; evaluated inside libxml2 for each scrape
+_FIRST_TABLE_ROWS_XPATH = etree.XPath('(//table)[1]//tr')
+_FIRST_TABLE_BODY_ROWS_XPATH = etree.XPath('((//table)[1]//tr)[position() > 1]')
+_ROW_CELLS_XPATH = etree.XPath('./td')
+# NIFA groups schools under single-cell rows holding the state name in <strong>
+_NIFA_STATE_ROW_XPATH = etree.XPath('count(td) = 1 and td//strong')
+# Case-insensitive substring match, without lower()-ing every name
+_UNI_RE = re.compile(r'university|college', re.IGNORECASE)
+
+def _read_excel(content):
+    """Read an xlsx payload with the Rust calamine engine, falling back to openpyxl"""
+    try:
+        return pd.read_excel(BytesIO(content), engine='calamine')
+    except ImportError:
+        return pd.read_excel(BytesIO(content), engine='openpyxl')
+
+_CMS_CSV_COLUMNS = {
+    'Hospital Name', 'Facility Name', 'State', 'City', 'Address',
+    'Hospital Type', 'Hospital overall rating', 'Hospital Ownership'
+}
+
+def _sniff_csv_dialect(content, sample_size=65536):
+    """Detect the delimiter/quoting of a CSV payload from its head, defaulting to excel"""
+    sample = content[:sample_size].decode('utf-8', errors='replace')
+    # Don't let the sniffer see a truncated final line
+    sample = sample[:sample.rfind('\n') + 1] or sample
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=',;\t')
+    except csv.Error:
+        return csv.excel
+
+def _as_objects(frame):
+    """Convert a Series/DataFrame to Python objects with missing values as None"""
+    return frame.astype(object).where(frame.notna(), None)
+
+def _coalesce(df, candidates):
+    """Per row, the first non-null value among the candidate columns present in df"""
+    result = None
+    for col in candidates:
+        if col in df.columns:
+            result = df[col] if result is None else result.combine_first(df[col])
+    return result if result is not None else pd.Series(None, index=df.index, dtype=object)
+
+def _stripped(series):
+    """String values with surrounding whitespace removed; missing values stay missing"""
+    return series.astype(str).str.strip().where(series.notna())
+
+# Lower-case column name fragments, in order of preference
+_HRSA_NAME_TERMS = ('site_name', 'facility_name', 'name', 'facility', 'center_name', 'organization')
+_HRSA_COUNTRY_TERMS = ('country',)
+
+def _find_column(cols_lower, terms):
+    """Column whose lower-cased name equals a term, else the first containing any term"""
+    for term in terms:
+        if term in cols_lower:
+            return cols_lower[term]
+    for lowered, col in cols_lower.items():
+        if any(term in lowered for term in terms):
+            return col
+    return None
+
+# Valid coordinate magnitude per field
+_COORDINATE_LIMITS = {'latitude': 90, 'longitude': 180}
+
+def _in_range(values, limit):
+    """Coerce to float, masking unparseable values and those outside +/-limit as NaN"""
+    values = pd.to_numeric(values, errors='coerce').astype(float)
+    return values.where(values.between(-limit, limit))
+
+def _coordinate(df, candidates, limit):
+    """First parseable coordinate among the candidate columns; NaN when outside +/-limit"""
+    values = pd.Series(float('nan'), index=df.index)
+    for col in candidates:
+        if col in df.columns:
+            values = values.fillna(pd.to_numeric(df[col], errors='coerce'))
+    return _in_range(values, limit)
+
+# State values repeat across thousands of rows; keep one interned copy of each
+_state_cache = {}
+
+def _norm_state(state):
+    """Strip and intern a raw state value, memoized on the raw string"""
+    value = _state_cache.get(state)
+    if value is None:
+        value = _state_cache[state] = sys.intern(state.strip())
+    return value
+
+# Major academic medical centers, used when the CMS teaching list is unavailable
+_FALLBACK_TEACHING_HOSPITALS = (
+    ('Mayo Clinic', 'Rochester', 'MN'),
+    ('Cleveland Clinic', 'Cleveland', 'OH'),
+    ('Johns Hopkins Hospital', 'Baltimore', 'MD'),
+    ('Massachusetts General Hospital', 'Boston', 'MA'),
+    ('UCLA Medical Center', 'Los Angeles', 'CA'),
+    ('New York-Presbyterian Hospital', 'New York', 'NY'),
+    ('UCSF Medical Center', 'San Francisco', 'CA'),
+    ('Brigham and Women\'s Hospital', 'Boston', 'MA'),
+    ('Hospital of the University of Pennsylvania', 'Philadelphia', 'PA'),
+    ('Duke University Hospital', 'Durham', 'NC'),
+    ('Stanford Health Care-Stanford Hospital', 'Stanford', 'CA'),
+    ('Northwestern Memorial Hospital', 'Chicago', 'IL'),
+    ('Cedars-Sinai Medical Center', 'Los Angeles', 'CA'),
+    ('Mount Sinai Hospital', 'New York', 'NY'),
+    ('Houston Methodist Hospital', 'Houston', 'TX'),
+    ('University of Michigan Hospitals', 'Ann Arbor', 'MI'),
+    ('Barnes-Jewish Hospital', 'St. Louis', 'MO'),
+    ('Vanderbilt University Medical Center', 'Nashville', 'TN'),
+    ('University of Washington Medical Center', 'Seattle', 'WA'),
+    ('Emory University Hospital', 'Atlanta', 'GA')
+)
+
+# Sample of known major FQHCs and community health centers, used when HRSA is unavailable
+_FALLBACK_CLINICS = (
+    ('Community Health Center of Buffalo', 'Buffalo', 'NY'),
+    ('Alliance Community Health Center', 'Boston', 'MA'),
+    ('Central City Concern', 'Portland', 'OR'),
+    ('Community Health Center of Richmond', 'Richmond', 'VA'),
+    ('Denver Health Community Health Centers', 'Denver', 'CO'),
+    ('Houston Community Health Centers', 'Houston', 'TX'),
+    ('Los Angeles Community Health Center', 'Los Angeles', 'CA'),
+    ('Chicago Family Health Center', 'Chicago', 'IL'),
+    ('Miami Community Health Center', 'Miami', 'FL'),
+    ('Seattle Community Health Centers', 'Seattle', 'WA')
+)
+
+# Fallback records are built once at import; callers get copies since normalize() edits them in place
+_FALLBACK_TEACHING_HOSPITAL_RECORDS = tuple(
+    InstitutionRecord(
+        name=name,
+        city=city,
+        state=state,
+        type=InstitutionType.ACADEMIC_MEDICAL_CENTER,
+        additional_attributes={
+            'source': 'Fallback Teaching Hospitals',
+            'category': 'Major Academic Medical Center'
+        }
+    )
+    for name, city, state in _FALLBACK_TEACHING_HOSPITALS
+)
+
+_FALLBACK_CLINIC_RECORDS = tuple(
+    InstitutionRecord(
+        name=name,
+        city=city,
+        state=state,
+        type=InstitutionType.CLINIC,
+        additional_attributes={
+            'type': 'Community Health Center',
+            'source': 'Fallback Clinics',
+            'category': 'FQHC/Community Health Center'
+        }
+    )
+    for name, city, state in _FALLBACK_CLINICS
+)
+
+def _copy_records(records):
+    """Fresh copies of prebuilt records, each with its own additional_attributes dict"""
+    return [replace(record, additional_attributes=dict(record.additional_attributes)) for record in records]
+
 class USAExtractor(BaseExtractor):
     def __init__(self):
         super().__init__('USA')
 
     def fetch_data(self):
-        all_data = []
-        all_data += self.fetch_vet_nifa() or []
-        all_data += self.fetch_avma_vet('United States') or []
-        all_data += self.fetch_md_lcme() or []
-        all_data += self.fetch_do_aacom() or []
-        all_data += self.fetch_hospitals_cms() or []
-        all_data += self.fetch_teaching_cms() or []
-        all_data += self.fetch_clinics_hrsa() or []
+        all_data = self.fetch_concurrently((
+            self.fetch_vet_nifa,
+            lambda: self.fetch_avma_vet('United States'),
+            self.fetch_md_lcme,
+            self.fetch_do_aacom,
+            self.fetch_hospitals_cms,
+            self.fetch_teaching_cms,
+            self.fetch_clinics_hrsa,
+        ))
         logger.info(f"Fetched {len(all_data)} raw records from all sources for USA")
         return all_data
 
@@ -33,25 +283,25 @@ class USAExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
-            table = soup.find('table')
+            tree = html.fromstring(response.content)
             data = []
             current_state = None
             
-            if table:
-                for row in table.find_all('tr'):
-                    cols = row.find_all('td')
-                    if len(cols) == 1 and cols[0].find('strong'):
-                        current_state = cols[0].text.strip()
-                    elif len(cols) > 0 and current_state:
-                        name = cols[0].text.strip()
-                        if name and ('university' in name.lower() or 'college' in name.lower()):
-                            data.append({
-                                'name': name,
-                                'state': current_state,
-                                'type': InstitutionType.VETERINARY_SCHOOL,
-                                'additional_attributes': {'source': 'NIFA'}
-                            })
+            for row in _FIRST_TABLE_ROWS_XPATH(tree):
+                if _NIFA_STATE_ROW_XPATH(row):
+                    current_state = _ROW_CELLS_XPATH(row)[0].text_content().strip()
+                elif current_state:
+                    cols = _ROW_CELLS_XPATH(row)
+                    if not cols:
+                        continue
+                    name = cols[0].text_content().strip()
+                    if _UNI_RE.search(name):
+                        data.append(InstitutionRecord(
+                            name=name,
+                            state=current_state,
+                            type=InstitutionType.VETERINARY_SCHOOL,
+                            additional_attributes={'source': 'NIFA'}
+                        ))
             logger.info(f"Fetched {len(data)} vet schools from NIFA")
             return data
         except Exception as e:
@@ -64,34 +314,45 @@ class USAExtractor(BaseExtractor):
             response = self.get_with_retry(url)
             if not response:
                 return []
-            soup = BeautifulSoup.BeautifulSoup(response.text, 'lxml')
-            table = soup.find('table')
-            data = []
+            # Only rows with all four cells are schools; state headings (colspan) and notes
+            # have fewer, which read_html would pad or copy across columns
+            tree = html.fromstring(response.content)
+            rows = [
+                [col.text_content().strip() for col in cols[:4]]
+                for cols in map(_ROW_CELLS_XPATH, _FIRST_TABLE_BODY_ROWS_XPATH(tree))
+                if len(cols) >= 4
+            ]
+            if not rows:
+                logger.info("Fetched 0 MD schools from LCME")
+                return []
+            df = pd.DataFrame(rows, columns=['name', 'location', 'sponsorship', 'status'], dtype=str)
             
-            if table:
-                for row in table.find_all('tr')[1:]:
-                    cols = row.find_all('td')
-                    if len(cols) >= 4:
-                        name = cols[0].text.strip()
-                        location = cols[1].text.strip()
-                        sponsorship = cols[2].text.strip()
-                        status = cols[3].text.strip()
-                        
-                        # Parse location
-                        city, state = location.rsplit(',', 1) if ',' in location else (location, None)
-                        
-                        data.append({
-                            'name': name,
-                            'city': city.strip(),
-                            'state': state.strip() if state else None,
-                            'type': InstitutionType.MEDICAL_SCHOOL,
-                            'additional_attributes': {
-                                'sponsorship': sponsorship, 
-                                'status': status, 
-                                'degree': 'MD', 
-                                'source': 'LCME'
-                            }
-                        })
+            # Parse location
+            location = df['location'].str.strip().str.rsplit(',', n=1, expand=True)
+            city = location[0].str.strip()
+            if location.shape[1] > 1:
+                state = location[1].str.strip()
+                state = state.where(state != '').map(_norm_state, na_action='ignore')
+            else:
+                state = pd.Series(None, index=df.index, dtype=object)
+            
+            data = [
+                InstitutionRecord(
+                    name=row['name'].strip(),
+                    city=row_city,
+                    state=row_state,
+                    type=InstitutionType.MEDICAL_SCHOOL,
+                    additional_attributes={
+                        'sponsorship': row['sponsorship'].strip(), 
+                        'status': row['status'].strip(), 
+                        'degree': 'MD', 
+                        'source': 'LCME'
+                    }
+                )
+                for row, row_city, row_state in zip(
+                    df.to_dict(orient='records'), city.tolist(), _as_objects(state).tolist()
+                )
+            ]
             logger.info(f"Fetched {len(data)} MD schools from LCME")
             return data
         except Exception as e:
@@ -105,41 +366,35 @@ class USAExtractor(BaseExtractor):
             if not response:
                 return []
             
-            with tempfile.NamedTemporaryFile(suffix='.pdf') as tmp:
-                tmp.write(response.content)
-                with pdfplumber.open(tmp.name) as pdf:
-                    data = []
-                    text = ''
-                    for page in pdf.pages:
-                        text += page.extract_text() + '\n'
+            data = []
+            # Join once rather than growing a string page by page
+            text = ''.join(f'{page_text}\n' for page_text in _pdf_page_texts(response.content))
+            
+            # Parse the text for school information
+            split = _AACOM_SPLIT_RE.split
+            for line in _aacom_school_lines(text):
+                parts = split(line, maxsplit=1)
+                if len(parts) >= 4:
+                    name = parts[0].strip()
+                    state = parts[1]
+                    website = parts[2]
                     
-                    # Parse the text for school information
-                    lines = text.split('\n')
-                    for line in lines:
-                        # Look for lines that match school pattern
-                        if re.match(r'^[A-Z].+ [A-Z]{2} https?://', line):
-                            parts = re.split(r' (\w{2}) (https?://\S+)', line)
-                            if len(parts) >= 4:
-                                name = parts[0].strip()
-                                state = parts[1]
-                                website = parts[2]
-                                
-                                # Extract city if present
-                                city = None
-                                if ',' in name:
-                                    name_parts = name.split(',')
-                                    if len(name_parts) > 1:
-                                        name = name_parts[0].strip()
-                                        city = name_parts[-1].strip()
-                                
-                                data.append({
-                                    'name': name,
-                                    'city': city,
-                                    'state': state,
-                                    'website': website,
-                                    'type': InstitutionType.MEDICAL_SCHOOL,
-                                    'additional_attributes': {'degree': 'DO', 'source': 'AACOM'}
-                                })
+                    # Extract city if present
+                    city = None
+                    if ',' in name:
+                        name_parts = name.split(',')
+                        if len(name_parts) > 1:
+                            name = name_parts[0].strip()
+                            city = name_parts[-1].strip()
+                    
+                    data.append(InstitutionRecord(
+                        name=name,
+                        city=city,
+                        state=state,
+                        website=website,
+                        type=InstitutionType.MEDICAL_SCHOOL,
+                        additional_attributes={'degree': 'DO', 'source': 'AACOM'}
+                    ))
             logger.info(f"Fetched {len(data)} DO schools from AACOM PDF")
             return data
         except Exception as e:
@@ -155,13 +410,11 @@ class USAExtractor(BaseExtractor):
                 "https://data.cms.gov/provider-data/dataset/xubh-q36u.json"
             ]
             
-            for api_url in api_urls:
-                logger.info(f"Trying CMS hospitals API: {api_url}")
-                response = self.get_with_retry(api_url, retries=1)
-                
+            logger.info(f"Trying {len(api_urls)} CMS hospitals API endpoints")
+            for api_url, response in self.iter_responses(api_urls, retries=1):
                 if response and response.status_code == 200:
                     try:
-                        json_data = response.json()
+                        json_data = _parse_json(response)
                         data = []
                         
                         # Handle different JSON structures
@@ -187,21 +440,21 @@ class USAExtractor(BaseExtractor):
                                     lat = record['location'].get('latitude')
                                     lng = record['location'].get('longitude')
                                 
-                                data.append({
-                                    'name': str(name).strip(),
-                                    'type': InstitutionType.HOSPITAL,
-                                    'state': record.get('state'),
-                                    'city': record.get('city'),
-                                    'address': record.get('address'),
-                                    'latitude': lat,
-                                    'longitude': lng,
-                                    'additional_attributes': {
+                                data.append(InstitutionRecord(
+                                    name=str(name).strip(),
+                                    type=InstitutionType.HOSPITAL,
+                                    state=record.get('state'),
+                                    city=record.get('city'),
+                                    address=record.get('address'),
+                                    latitude=lat,
+                                    longitude=lng,
+                                    additional_attributes={
                                         'hospital_type': record.get('hospital_type'),
                                         'rating': record.get('hospital_overall_rating'),
                                         'ownership': record.get('hospital_ownership'),
                                         'source': 'CMS'
                                     }
-                                })
+                                ))
                         
                         if data:
                             logger.info(f"Fetched {len(data)} hospitals from CMS API")
@@ -214,35 +467,50 @@ class USAExtractor(BaseExtractor):
             # If API fails, try CSV download
             logger.info("API methods failed, trying CSV download...")
             csv_url = "https://data.cms.gov/provider-data/sites/default/files/resources/092256becd267d9eeccf73bf8eaa1e1b_1729555442/Hospital_General_Information.csv"
-            response = self.get_with_retry(csv_url, retries=1)
+            response = self.get_with_retry(csv_url, retries=1, stream=True)
             
             if response and response.status_code == 200:
                 try:
-                    df = pd.read_csv(StringIO(response.text))
-                    data = []
+                    # Parse straight off the socket, keeping only the columns we use
+                    response.raw.decode_content = True
+                    df = pd.read_csv(response.raw, usecols=lambda col: col in _CMS_CSV_COLUMNS, dtype='string')
                     
-                    for _, row in df.iterrows():
-                        name = row.get('Hospital Name') or row.get('Facility Name')
-                        if name and pd.notna(name):
-                            data.append({
-                                'name': str(name).strip(),
-                                'type': InstitutionType.HOSPITAL,
-                                'state': row.get('State'),
-                                'city': row.get('City'),
-                                'address': row.get('Address'),
-                                'additional_attributes': {
-                                    'hospital_type': row.get('Hospital Type'),
-                                    'rating': row.get('Hospital overall rating'),
-                                    'ownership': row.get('Hospital Ownership'),
-                                    'source': 'CMS CSV'
-                                }
-                            })
+                    frame = pd.DataFrame({
+                        'name': _coalesce(df, ['Hospital Name', 'Facility Name']),
+                        'state': _coalesce(df, ['State']),
+                        'city': _coalesce(df, ['City']),
+                        'address': _coalesce(df, ['Address']),
+                        'hospital_type': _coalesce(df, ['Hospital Type']),
+                        'rating': _coalesce(df, ['Hospital overall rating']),
+                        'ownership': _coalesce(df, ['Hospital Ownership'])
+                    })
+                    frame = frame[frame['name'].notna()]
+                    frame['name'] = frame['name'].astype(str).str.strip()
+                    
+                    data = [
+                        InstitutionRecord(
+                            name=row['name'],
+                            type=InstitutionType.HOSPITAL,
+                            state=row['state'],
+                            city=row['city'],
+                            address=row['address'],
+                            additional_attributes={
+                                'hospital_type': row['hospital_type'],
+                                'rating': row['rating'],
+                                'ownership': row['ownership'],
+                                'source': 'CMS CSV'
+                            }
+                        )
+                        for row in _as_objects(frame).to_dict(orient='records')
+                    ]
                     
                     logger.info(f"Fetched {len(data)} hospitals from CMS CSV")
                     return data
                     
                 except Exception as e:
                     logger.error(f"Error parsing CMS CSV: {e}")
+                finally:
+                    response.close()
             
             # Final fallback - return empty list with warning
             logger.warning("All CMS hospital data sources failed")
@@ -258,11 +526,9 @@ class USAExtractor(BaseExtractor):
             years = ['2024', '2025', '2023']
             base_url = "https://www.cms.gov/files/document/{year}-reporting-cycle-teaching-hospital-list.xlsx"
             
-            for year in years:
-                url = base_url.format(year=year)
-                logger.info(f"Trying CMS teaching hospitals for {year}...")
-                response = self.get_with_retry(url, retries=1)  # Reduce retries for 404s
-                
+            logger.info(f"Trying CMS teaching hospitals for {', '.join(years)}...")
+            urls = [base_url.format(year=year) for year in years]
+            for year, (url, response) in zip(years, self.iter_responses(urls, retries=1)):  # Reduce retries for 404s
                 if response and response.status_code == 200:
                     logger.info(f"Found CMS teaching hospitals file for {year}")
                     break
@@ -270,67 +536,63 @@ class USAExtractor(BaseExtractor):
                 logger.warning("Could not find current CMS teaching hospitals file, using fallback")
                 return self.fetch_teaching_hospitals_fallback()
             
-            with tempfile.NamedTemporaryFile(suffix='.xlsx') as tmp:
-                tmp.write(response.content)
-                try:
-                    df = pd.read_excel(tmp.name)
-                    data = []
-                    
-                    # Handle different possible column names
-                    name_cols = ['Teaching_Hospital_Name', 'Hospital_Name', 'Facility_Name']
-                    name_col = None
-                    for col in name_cols:
-                        if col in df.columns:
-                            name_col = col
-                            break
-                    
-                    if not name_col and len(df.columns) > 0:
-                        name_col = df.columns[0]  # Use first column as fallback
-                    
-                    if not name_col:
-                        logger.error("Could not identify hospital name column in CMS file")
-                        return []
-                    
-                    for _, row in df.iterrows():
-                        name = row.get(name_col)
-                        if name and pd.notna(name):
-                            # Construct address from available fields
-                            address_parts = []
-                            for addr_field in ['Address', 'Address_Line_1', 'Street']:
-                                if addr_field in row and pd.notna(row.get(addr_field)):
-                                    address_parts.append(str(row.get(addr_field)))
-                            
-                            city = row.get('City') if 'City' in row and pd.notna(row.get('City')) else None
-                            state = row.get('State') if 'State' in row and pd.notna(row.get('State')) else None
-                            zip_code = row.get('Zip') if 'Zip' in row and pd.notna(row.get('Zip')) else None
-                            
-                            if city:
-                                address_parts.append(city)
-                            if state:
-                                address_parts.append(state)
-                            if zip_code:
-                                address_parts.append(str(zip_code))
-                            
-                            address = ', '.join(address_parts) if address_parts else None
-                            
-                            data.append({
-                                'name': str(name).strip(),
-                                'type': InstitutionType.ACADEMIC_MEDICAL_CENTER,
-                                'address': address,
-                                'city': city,
-                                'state': state,
-                                'additional_attributes': {
-                                    'ccn': row.get('CCN') if 'CCN' in row else None,
-                                    'source': f'CMS Teaching {year}'
-                                }
-                            })
-                    
-                    logger.info(f"Fetched {len(data)} teaching hospitals from CMS")
-                    return data
-                    
-                except Exception as e:
-                    logger.error(f"Error reading Excel file: {e}")
-                    return self.fetch_teaching_hospitals_fallback()
+            try:
+                df = _read_excel(response.content)
+                
+                # Handle different possible column names
+                name_cols = ['Teaching_Hospital_Name', 'Hospital_Name', 'Facility_Name']
+                name_col = None
+                for col in name_cols:
+                    if col in df.columns:
+                        name_col = col
+                        break
+                
+                if not name_col and len(df.columns) > 0:
+                    name_col = df.columns[0]  # Use first column as fallback
+                
+                if not name_col:
+                    logger.error("Could not identify hospital name column in CMS file")
+                    return []
+                
+                names = df[name_col]
+                keep = names.notna() & (names.astype(str).str.strip() != '')
+                
+                # Construct address from available fields
+                address_cols = [col for col in ['Address', 'Address_Line_1', 'Street'] if col in df.columns]
+                frame = _as_objects(pd.DataFrame({
+                    'name': names.astype(str).str.strip(),
+                    'city': _coalesce(df, ['City']),
+                    'state': _coalesce(df, ['State']),
+                    'zip': _coalesce(df, ['Zip']),
+                    'ccn': _coalesce(df, ['CCN'])
+                }).join(df[address_cols].add_prefix('addr_'))[keep])
+                address_parts = frame[[f'addr_{col}' for col in address_cols] + ['city', 'state', 'zip']]
+                addresses = [
+                    ', '.join(str(part) for part in parts if part is not None and part != '') or None
+                    for parts in address_parts.itertuples(index=False, name=None)
+                ]
+                
+                data = [
+                    InstitutionRecord(
+                        name=row['name'],
+                        type=InstitutionType.ACADEMIC_MEDICAL_CENTER,
+                        address=address,
+                        city=row['city'],
+                        state=row['state'],
+                        additional_attributes={
+                            'ccn': row['ccn'],
+                            'source': f'CMS Teaching {year}'
+                        }
+                    )
+                    for row, address in zip(frame.to_dict(orient='records'), addresses)
+                ]
+                
+                logger.info(f"Fetched {len(data)} teaching hospitals from CMS")
+                return data
+                
+            except Exception as e:
+                logger.error(f"Error reading Excel file: {e}")
+                return self.fetch_teaching_hospitals_fallback()
                     
         except Exception as e:
             logger.error(f"Error fetching CMS teaching: {e}")
@@ -338,50 +600,7 @@ class USAExtractor(BaseExtractor):
 
     def fetch_teaching_hospitals_fallback(self):
         """Fallback method for teaching hospitals when CMS file is unavailable"""
-        try:
-            # Use a known list of major academic medical centers
-            teaching_hospitals = [
-                {'name': 'Mayo Clinic', 'city': 'Rochester', 'state': 'MN'},
-                {'name': 'Cleveland Clinic', 'city': 'Cleveland', 'state': 'OH'},
-                {'name': 'Johns Hopkins Hospital', 'city': 'Baltimore', 'state': 'MD'},
-                {'name': 'Massachusetts General Hospital', 'city': 'Boston', 'state': 'MA'},
-                {'name': 'UCLA Medical Center', 'city': 'Los Angeles', 'state': 'CA'},
-                {'name': 'New York-Presbyterian Hospital', 'city': 'New York', 'state': 'NY'},
-                {'name': 'UCSF Medical Center', 'city': 'San Francisco', 'state': 'CA'},
-                {'name': 'Brigham and Women\'s Hospital', 'city': 'Boston', 'state': 'MA'},
-                {'name': 'Hospital of the University of Pennsylvania', 'city': 'Philadelphia', 'state': 'PA'},
-                {'name': 'Duke University Hospital', 'city': 'Durham', 'state': 'NC'},
-                {'name': 'Stanford Health Care-Stanford Hospital', 'city': 'Stanford', 'state': 'CA'},
-                {'name': 'Northwestern Memorial Hospital', 'city': 'Chicago', 'state': 'IL'},
-                {'name': 'Cedars-Sinai Medical Center', 'city': 'Los Angeles', 'state': 'CA'},
-                {'name': 'Mount Sinai Hospital', 'city': 'New York', 'state': 'NY'},
-                {'name': 'Houston Methodist Hospital', 'city': 'Houston', 'state': 'TX'},
-                {'name': 'University of Michigan Hospitals', 'city': 'Ann Arbor', 'state': 'MI'},
-                {'name': 'Barnes-Jewish Hospital', 'city': 'St. Louis', 'state': 'MO'},
-                {'name': 'Vanderbilt University Medical Center', 'city': 'Nashville', 'state': 'TN'},
-                {'name': 'University of Washington Medical Center', 'city': 'Seattle', 'state': 'WA'},
-                {'name': 'Emory University Hospital', 'city': 'Atlanta', 'state': 'GA'}
-            ]
-            
-            data = []
-            for hospital in teaching_hospitals:
-                data.append({
-                    'name': hospital['name'],
-                    'city': hospital['city'],
-                    'state': hospital['state'],
-                    'type': InstitutionType.ACADEMIC_MEDICAL_CENTER,
-                    'additional_attributes': {
-                        'source': 'Fallback Teaching Hospitals',
-                        'category': 'Major Academic Medical Center'
-                    }
-                })
-            
-            logger.info(f"Using fallback list of {len(data)} major teaching hospitals")
-            return data
-            
-        except Exception as e:
-            logger.error(f"Error in teaching hospitals fallback: {e}")
-            return []
+        return _copy_records(_FALLBACK_TEACHING_HOSPITAL_RECORDS)
 
     def fetch_clinics_hrsa(self):
         try:
@@ -397,48 +616,27 @@ class USAExtractor(BaseExtractor):
                 
                 if response and response.status_code == 200:
                     try:
-                        # Try multiple CSV parsing strategies
-                        parsing_strategies = [
-                            # Strategy 1: Standard parsing
-                            {'sep': ',', 'quotechar': '"', 'error_bad_lines': False, 'warn_bad_lines': True},
-                            # Strategy 2: Handle quoted fields better
-                            {'sep': ',', 'quotechar': '"', 'quoting': 1, 'error_bad_lines': False},
-                            # Strategy 3: More lenient parsing
-                            {'sep': ',', 'engine': 'python', 'error_bad_lines': False, 'warn_bad_lines': False},
-                            # Strategy 4: Try semicolon separator
-                            {'sep': ';', 'error_bad_lines': False, 'warn_bad_lines': False}
-                        ]
-                        
-                        df = None
-                        for i, strategy in enumerate(parsing_strategies):
-                            try:
-                                logger.info(f"Trying CSV parsing strategy {i+1}")
-                                df = pd.read_csv(StringIO(response.text), **strategy)
-                                if len(df) > 0:
-                                    logger.info(f"Successfully parsed CSV with strategy {i+1}, got {len(df)} rows")
-                                    break
-                            except Exception as parse_error:
-                                logger.warning(f"CSV parsing strategy {i+1} failed: {parse_error}")
-                                continue
+                        # Detect the dialect once, then parse the payload a single time. The C
+                        # engine pads short rows (empty trailing columns) with NaN; pyarrow's
+                        # on_bad_lines='skip' would silently drop those clinics
+                        dialect = _sniff_csv_dialect(response.content)
+                        df = pd.read_csv(
+                            BytesIO(response.content),
+                            sep=dialect.delimiter,
+                            quotechar=dialect.quotechar,
+                            on_bad_lines='skip',
+                            engine='c'
+                        )
+                        logger.info(f"Parsed HRSA CSV (delimiter {dialect.delimiter!r}), got {len(df)} rows")
                         
-                        if df is None or len(df) == 0:
-                            logger.warning("All CSV parsing strategies failed for this URL")
+                        if len(df) == 0:
+                            logger.warning("No rows parsed from this CSV")
                             continue
                         
-                        data = []
-                        
                         # Handle different column naming conventions - be more flexible
-                        country_col = None
-                        name_col = None
-                        
-                        # More comprehensive column detection
-                        for col in df.columns:
-                            col_lower = str(col).lower()
-                            if any(term in col_lower for term in ['country']):
-                                country_col = col
-                            if any(term in col_lower for term in ['site_name', 'facility_name', 'name', 'facility', 'center_name', 'organization']):
-                                if name_col is None:  # Take first match
-                                    name_col = col
+                        cols_lower = {str(col).lower(): col for col in df.columns}
+                        country_col = _find_column(cols_lower, _HRSA_COUNTRY_TERMS)
+                        name_col = _find_column(cols_lower, _HRSA_NAME_TERMS)
                         
                         # If no specific name column found, use first column
                         if not name_col and len(df.columns) > 0:
@@ -449,93 +647,46 @@ class USAExtractor(BaseExtractor):
                             logger.warning("Could not identify facility name column")
                             continue
                         
-                        # Process each row
-                        valid_rows = 0
-                        for _, row in df.iterrows():
-                            try:
-                                # Filter for US locations if country column exists
-                                if country_col:
-                                    country_val = str(row.get(country_col, '')).strip().upper()
-                                    if country_val not in ['US', 'USA', 'UNITED STATES', '']:
-                                        continue
-                                
-                                site_name = row.get(name_col)
-                                if site_name and pd.notna(site_name) and str(site_name).strip():
-                                    site_name = str(site_name).strip()
-                                    
-                                    # Handle coordinates with error checking
-                                    lat = None
-                                    lng = None
-                                    
-                                    for lat_col in ['Latitude', 'latitude', 'lat', 'Lat']:
-                                        if lat_col in row and pd.notna(row.get(lat_col)):
-                                            try:
-                                                lat = float(row.get(lat_col))
-                                                if not (-90 <= lat <= 90):  # Validate latitude range
-                                                    lat = None
-                                                break
-                                            except (ValueError, TypeError):
-                                                continue
-                                    
-                                    for lng_col in ['Longitude', 'longitude', 'lng', 'Lng', 'long']:
-                                        if lng_col in row and pd.notna(row.get(lng_col)):
-                                            try:
-                                                lng = float(row.get(lng_col))
-                                                if not (-180 <= lng <= 180):  # Validate longitude range
-                                                    lng = None
-                                                break
-                                            except (ValueError, TypeError):
-                                                continue
-                                    
-                                    # Get other fields with error handling
-                                    state = None
-                                    city = None
-                                    address = None
-                                    site_type = None
-                                    
-                                    for state_col in ['State', 'state', 'State_Abbreviation']:
-                                        if state_col in row and pd.notna(row.get(state_col)):
-                                            state = str(row.get(state_col)).strip()
-                                            break
-                                    
-                                    for city_col in ['City', 'city', 'City_Name']:
-                                        if city_col in row and pd.notna(row.get(city_col)):
-                                            city = str(row.get(city_col)).strip()
-                                            break
-                                    
-                                    for addr_col in ['Address', 'address', 'Street_Address', 'Address_Line_1']:
-                                        if addr_col in row and pd.notna(row.get(addr_col)):
-                                            address = str(row.get(addr_col)).strip()
-                                            break
-                                    
-                                    for type_col in ['Site_Type', 'Type', 'Facility_Type', 'Organization_Type']:
-                                        if type_col in row and pd.notna(row.get(type_col)):
-                                            site_type = str(row.get(type_col)).strip()
-                                            break
-                                    
-                                    data.append({
-                                        'name': site_name,
-                                        'type': InstitutionType.CLINIC,
-                                        'state': state,
-                                        'city': city,
-                                        'address': address,
-                                        'latitude': lat,
-                                        'longitude': lng,
-                                        'additional_attributes': {
-                                            'type': site_type,
-                                            'fqhc': str(row.get('FQHC', '')).strip() if 'FQHC' in row else None,
-                                            'source': 'HRSA',
-                                            'data_source_url': csv_url
-                                        }
-                                    })
-                                    valid_rows += 1
-                                    
-                            except Exception as row_error:
-                                logger.debug(f"Error processing row: {row_error}")
-                                continue
+                        frame = pd.DataFrame({
+                            'name': _stripped(df[name_col]),
+                            'state': _stripped(_coalesce(df, ['State', 'state', 'State_Abbreviation'])),
+                            'city': _stripped(_coalesce(df, ['City', 'city', 'City_Name'])),
+                            'address': _stripped(_coalesce(df, ['Address', 'address', 'Street_Address', 'Address_Line_1'])),
+                            'latitude': _coordinate(df, ['Latitude', 'latitude', 'lat', 'Lat'], _COORDINATE_LIMITS['latitude']),
+                            'longitude': _coordinate(df, ['Longitude', 'longitude', 'lng', 'Lng', 'long'], _COORDINATE_LIMITS['longitude']),
+                            'site_type': _stripped(_coalesce(df, ['Site_Type', 'Type', 'Facility_Type', 'Organization_Type'])),
+                            'fqhc': _stripped(df['FQHC']) if 'FQHC' in df.columns else None
+                        })
+                        
+                        keep = frame['name'].notna() & (frame['name'] != '')
+                        # Filter for US locations if country column exists
+                        if country_col:
+                            country_val = _stripped(df[country_col]).fillna('').str.upper()
+                            keep &= country_val.isin(['US', 'USA', 'UNITED STATES', ''])
+                        
+                        # Plain tuples in frame column order; no per-row dict or label lookups
+                        data = [
+                            InstitutionRecord(
+                                name=name,
+                                type=InstitutionType.CLINIC,
+                                state=state,
+                                city=city,
+                                address=address,
+                                latitude=latitude,
+                                longitude=longitude,
+                                additional_attributes={
+                                    'type': site_type,
+                                    'fqhc': fqhc,
+                                    'source': 'HRSA',
+                                    'data_source_url': csv_url
+                                }
+                            )
+                            for name, state, city, address, latitude, longitude, site_type, fqhc
+                            in _as_objects(frame[keep]).itertuples(index=False, name=None)
+                        ]
                         
                         if data:
-                            logger.info(f"Successfully processed {valid_rows} valid rows out of {len(df)} total rows")
+                            logger.info(f"Successfully processed {len(data)} valid rows out of {len(df)} total rows")
                             logger.info(f"Fetched {len(data)} clinics from HRSA")
                             return data
                         else:
@@ -557,65 +708,29 @@ class USAExtractor(BaseExtractor):
 
     def fetch_clinics_fallback(self):
         """Fallback method for clinics when HRSA data is unavailable"""
-        try:
-            # Sample of known major FQHCs and community health centers
-            fallback_clinics = [
-                {'name': 'Community Health Center of Buffalo', 'city': 'Buffalo', 'state': 'NY'},
-                {'name': 'Alliance Community Health Center', 'city': 'Boston', 'state': 'MA'},
-                {'name': 'Central City Concern', 'city': 'Portland', 'state': 'OR'},
-                {'name': 'Community Health Center of Richmond', 'city': 'Richmond', 'state': 'VA'},
-                {'name': 'Denver Health Community Health Centers', 'city': 'Denver', 'state': 'CO'},
-                {'name': 'Houston Community Health Centers', 'city': 'Houston', 'state': 'TX'},
-                {'name': 'Los Angeles Community Health Center', 'city': 'Los Angeles', 'state': 'CA'},
-                {'name': 'Chicago Family Health Center', 'city': 'Chicago', 'state': 'IL'},
-                {'name': 'Miami Community Health Center', 'city': 'Miami', 'state': 'FL'},
-                {'name': 'Seattle Community Health Centers', 'city': 'Seattle', 'state': 'WA'}
-            ]
-            
-            data = []
-            for clinic in fallback_clinics:
-                data.append({
-                    'name': clinic['name'],
-                    'city': clinic['city'],
-                    'state': clinic['state'],
-                    'type': InstitutionType.CLINIC,
-                    'additional_attributes': {
-                        'type': 'Community Health Center',
-                        'source': 'Fallback Clinics',
-                        'category': 'FQHC/Community Health Center'
-                    }
-                })
-            
-            logger.info(f"Using fallback list of {len(data)} community health centers")
-            return data
-            
-        except Exception as e:
-            logger.error(f"Error in clinics fallback: {e}")
-            return []
+        return _copy_records(_FALLBACK_CLINIC_RECORDS)
 
     def normalize(self, data):
         """Normalize US institution data"""
         for item in data:
             # Standardize state names/abbreviations
             if item.get('state'):
-                state = item['state'].strip()
                 # You could add a state abbreviation to full name mapping here
-                item['state'] = state
-            
-            # Clean institution names
-            if item.get('name'):
-                name = item['name']
-                # Remove common artifacts
-                name = re.sub(r'\s+', ' ', name)  # Multiple spaces to single
-                name = name.strip()
+                item['state'] = _norm_state(item['state'])
+        
+        # Clean institution names in one column-wise pass: collapse whitespace runs and strip
+        items = [item for item in data if item.get('name')]
+        if items:
+            names = pd.Series([item['name'] for item in items], dtype=str)
+            for item, name in zip(items, names.str.replace(r'\s+', ' ', regex=True).str.strip()):
                 item['name'] = name
-                
-            # Ensure coordinates are numeric
-            for coord in ['latitude', 'longitude']:
-                if item.get(coord):
-                    try:
-                        item[coord] = float(item[coord])
-                    except (ValueError, TypeError):
-                        item[coord] = None
+        
+        # Ensure coordinates are numeric and in range, one vectorized pass per column
+        for coord, limit in _COORDINATE_LIMITS.items():
+            items = [item for item in data if item.get(coord)]
+            if items:
+                values = _in_range(pd.Series([item[coord] for item in items], dtype=object), limit)
+                for item, value in zip(items, values.astype(object).where(values.notna(), None)):
+                    item[coord] = value
         
         return data
\ No newline at end of file
@@ -2,7 +2,7 @@ import logging
 import psycopg2
 from datetime import datetime, timedelta
 import json
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz
 import argparse
 import sys
 
@@ -5,93 +5,160 @@ Run this in a separate terminal while extraction is running
 """
 
 import psycopg2
-import time
+import select
 import sys
+import time
 from datetime import datetime
 from collections import defaultdict
 from config import DB_PARAMS
 
+NOTIFY_CHANNEL = 'inst_changed'  # raised by the notify_institutions_changed triggers
+
 class ProgressMonitor:
     def __init__(self, countries=None, refresh_interval=5):
         self.countries = countries or ['USA', 'IND', 'CHN', 'CAN']
         self.refresh_interval = refresh_interval
         self.previous_counts = defaultdict(int)
         self.start_time = datetime.now()
+        self.conn = None
+        self._last_lines = None  # lines drawn by the previous refresh
+        self._results = None  # counts from the last query, reused while nothing changes
+    
+    def _connection(self):
+        """Reuse one read-only autocommit connection across refreshes, connecting on first use.
+
+        The connection also LISTENs on the channel the institutions triggers notify.
+        """
+        if self.conn is None or self.conn.closed:
+            self.conn = psycopg2.connect(**DB_PARAMS)
+            self.conn.set_session(readonly=True, autocommit=True)
+            with self.conn.cursor() as cur:
+                cur.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                # The monitored countries are fixed, so the counts query is planned once per connection
+                where_clause = "WHERE country = ANY($1)" if self.countries else ""
+                cur.execute(f"""
+                    PREPARE inst_counts(text[]) AS
+                    SELECT 
+                        country,
+                        type,
+                        COUNT(*) as count,
+                        MAX(last_updated) as last_updated
+                    FROM institutions 
+                    {where_clause}
+                    GROUP BY GROUPING SETS ((country, type), (country), ())
+                    ORDER BY country NULLS LAST, type NULLS LAST
+                """)
+            self._results = None  # notifications may have been missed while disconnected
+        return self.conn
+    
+    def wait_for_changes(self, timeout):
+        """Block up to timeout seconds for change notifications.
+
+        Returns True when a monitored country changed (or the connection was lost and
+        the counts should be re-read), False when the wait timed out quietly.
+        """
+        if self.conn is None or self.conn.closed:
+            # The last query lost the database; wait out the interval and let the next
+            # refresh make the single reconnect attempt instead of spinning on it here
+            time.sleep(timeout)
+            return True
+        
+        try:
+            conn = self.conn
+            if not conn.notifies and not select.select([conn], [], [], timeout)[0]:
+                return False
+            conn.poll()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            print(f"Error waiting for changes: {e}")
+            self.close()
+            self._last_lines = None
+            time.sleep(timeout)
+            return True
+        
+        # Payloads are 'country:type'; drain them all so one bulk load wakes us once
+        changed = {notify.payload.split(':', 1)[0] for notify in conn.notifies}
+        conn.notifies.clear()
+        return not self.countries or bool(changed.intersection(self.countries))
+    
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
         
     def get_current_counts(self):
-        """Get current record counts by country and type"""
+        """Get record counts by country and type, plus per-country subtotals (type NULL)
+        and the grand total (country and type NULL)"""
         try:
-            conn = psycopg2.connect(**DB_PARAMS)
-            cur = conn.cursor()
+            cur = self._connection().cursor()
             
-            where_clause = "WHERE country = ANY(%s)" if self.countries else ""
-            params = [self.countries] if self.countries else []
-            
-            cur.execute(f"""
-                SELECT 
-                    country,
-                    type,
-                    COUNT(*) as count,
-                    MAX(last_updated) as last_updated
-                FROM institutions 
-                {where_clause}
-                GROUP BY country, type
-                ORDER BY country, type
-            """, params)
+            cur.execute("EXECUTE inst_counts(%s)", (self.countries or None,))
             
             results = cur.fetchall()
             cur.close()
-            conn.close()
             
             return results
             
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            # Connection dropped; reconnect on the next refresh
+            print(f"Error getting counts: {e}")
+            self.close()
+            self._last_lines = None  # the message scrolled the screen; repaint in full
+            return []
         except Exception as e:
             print(f"Error getting counts: {e}")
+            self._last_lines = None
             return []
     
-    def display_progress(self):
-        """Display current progress with changes"""
-        results = self.get_current_counts()
+    def display_progress(self, refresh=True):
+        """Display current progress with changes; without refresh the last counts are redrawn"""
+        if refresh or self._results is None:
+            self._results = self.get_current_counts()
+        results = self._results
+        lines = []
         
-        # Clear screen and move cursor to top
-        print('\033[2J\033[H')
+        lines.append("🔄 MEDICAL INSTITUTIONS EXTRACTION - LIVE MONITOR")
+        lines.append("=" * 70)
+        lines.append(f"Monitoring: {', '.join(self.countries)}")
+        lines.append(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Current: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Refresh: Every {self.refresh_interval} seconds")
+        lines.append("")
         
-        print("🔄 MEDICAL INSTITUTIONS EXTRACTION - LIVE MONITOR")
-        print("=" * 70)
-        print(f"Monitoring: {', '.join(self.countries)}")
-        print(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Current: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Refresh: Every {self.refresh_interval} seconds")
-        print()
-        
-        if not results:
-            print("⏳ No data found yet... Extraction may still be starting.")
+        # With no matching rows only the (NULL, NULL) grand total comes back
+        if not results or results[0][0] is None:
+            lines.append("⏳ No data found yet... Extraction may still be starting.")
+            self.render(lines)
             return
         
-        # Group by country
+        # Group by country; the database has already computed the subtotals
         country_data = defaultdict(list)
+        country_totals = {}
         total_current = 0
         
         for country, inst_type, count, last_updated in results:
-            country_data[country].append((inst_type, count, last_updated))
-            total_current += count
+            if country is None:
+                total_current = count
+            elif inst_type is None:
+                country_totals[country] = count
+            else:
+                country_data[country].append((inst_type, count, last_updated))
         
         total_previous = sum(self.previous_counts.values())
         total_change = total_current - total_previous
         
-        print(f"📊 SUMMARY: {total_current:,} total records (+{total_change:,} since last refresh)")
-        print()
+        lines.append(f"📊 SUMMARY: {total_current:,} total records (+{total_change:,} since last refresh)")
+        lines.append("")
         
         # Display by country
         for country in sorted(country_data.keys()):
             data = country_data[country]
-            country_total = sum(count for _, count, _ in data)
+            country_total = country_totals[country]
             country_previous = sum(self.previous_counts.get(f"{country}_{inst_type}", 0) 
                                  for inst_type, _, _ in data)
             country_change = country_total - country_previous
             
-            print(f"🌍 {country}: {country_total:,} total (+{country_change:,})")
-            print("-" * 50)
+            lines.append(f"🌍 {country}: {country_total:,} total (+{country_change:,})")
+            lines.append("-" * 50)
             
             for inst_type, count, last_updated in data:
                 key = f"{country}_{inst_type}"
@@ -108,37 +175,68 @@ class ProgressMonitor:
                 # Format last updated
                 time_str = last_updated.strftime('%H:%M:%S') if last_updated else 'Never'
                 
-                print(f"  {change_color} {inst_type.replace('_', ' ').title():25} | "
-                      f"{count:5,} {change_str:>8} | "
-                      f"Updated: {time_str}")
+                lines.append(f"  {change_color} {inst_type.replace('_', ' ').title():25} | "
+                             f"{count:5,} {change_str:>8} | "
+                             f"Updated: {time_str}")
             
-            print()
+            lines.append("")
         
         # Show extraction rate
         elapsed = (datetime.now() - self.start_time).total_seconds()
         if elapsed > 0:
             rate = total_current / elapsed * 60  # records per minute
-            print(f"⚡ Extraction rate: {rate:.1f} records/minute")
+            lines.append(f"⚡ Extraction rate: {rate:.1f} records/minute")
         
-        print()
-        print("Press Ctrl+C to stop monitoring")
+        lines.append("")
+        lines.append("Press Ctrl+C to stop monitoring")
+        self.render(lines)
+    
+    def render(self, lines):
+        """Repaint only the lines that changed since the last refresh.
+
+        The first frame clears the screen; after that each changed line is rewritten in
+        place (cursor to row, clear to end of line), so an unchanged table costs no output.
+        """
+        out = []
+        if self._last_lines is None:
+            out.append('\033[2J')
+            previous = []
+        else:
+            previous = self._last_lines
+        
+        for row, line in enumerate(lines, start=1):
+            if row > len(previous) or previous[row - 1] != line:
+                out.append(f'\033[{row};1H\033[K{line}')
+        # Blank out rows left over from a longer previous frame
+        for row in range(len(lines) + 1, len(previous) + 1):
+            out.append(f'\033[{row};1H\033[K')
+        
+        # Park the cursor below the table
+        out.append(f'\033[{len(lines) + 1};1H')
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
+        self._last_lines = lines
     
     def run(self):
         """Run the monitoring loop"""
         print("🚀 Starting extraction monitor...")
-        print("This will update every few seconds with live progress.")
+        print("This will update as soon as new records are committed.")
         print("Make sure extraction is running in another terminal!")
         print()
         
         try:
+            self.display_progress()
             while True:
-                self.display_progress()
-                time.sleep(self.refresh_interval)
+                # Idle ticks only redraw the clock and rate; counts are re-read when notified
+                changed = self.wait_for_changes(self.refresh_interval)
+                self.display_progress(refresh=changed)
                 
         except KeyboardInterrupt:
             print("\n\n👋 Monitoring stopped by user")
         except Exception as e:
             print(f"\n❌ Monitor error: {e}")
+        finally:
+            self.close()
 
 def main():
     import argparse
@@ -18,22 +18,39 @@ CREATE TABLE institutions (
     longitude DOUBLE PRECISION,
     additional_attributes JSONB,  -- For country-specific fields, e.g., {"accreditation": "AVMA", "bed_count": 500}
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    search_vector TSVECTOR  -- For full-text search
+    search_vector TSVECTOR GENERATED ALWAYS AS (  -- For full-text search
+        to_tsvector('english', COALESCE(name, '') || ' ' || COALESCE(country, ''))
+    ) STORED
 );
 
 -- Indexes for efficiency
 CREATE INDEX idx_country ON institutions(country);
 CREATE INDEX idx_name ON institutions(name);
+CREATE INDEX idx_country_type_updated ON institutions(country, type, last_updated);  -- covers per-country/type counts
 CREATE INDEX idx_search_vector ON institutions USING GIN(search_vector);
 
--- Trigger to update search_vector
-CREATE FUNCTION update_search_vector() RETURNS TRIGGER AS $$
+-- Change notifications for the progress monitor (LISTEN inst_changed), one per distinct country:type per statement
+CREATE FUNCTION notify_institutions_changed() RETURNS TRIGGER AS $$
 BEGIN
-    NEW.search_vector := to_tsvector('english', COALESCE(NEW.name, '') || ' ' || COALESCE(NEW.country, ''));
-    RETURN NEW;
+    IF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify('inst_changed', country || ':' || type)
+        FROM (SELECT DISTINCT country, type::text FROM old_rows) changed;
+    ELSE
+        PERFORM pg_notify('inst_changed', country || ':' || type)
+        FROM (SELECT DISTINCT country, type::text FROM new_rows) changed;
+    END IF;
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE TRIGGER trg_update_search_vector
-BEFORE INSERT OR UPDATE ON institutions
-FOR EACH ROW EXECUTE FUNCTION update_search_vector();
\ No newline at end of file
+CREATE TRIGGER trg_notify_insert
+AFTER INSERT ON institutions REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_institutions_changed();
+
+CREATE TRIGGER trg_notify_update
+AFTER UPDATE ON institutions REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_institutions_changed();
+
+CREATE TRIGGER trg_notify_delete
+AFTER DELETE ON institutions REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_institutions_changed();
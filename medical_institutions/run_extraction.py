@@ -11,6 +11,7 @@ from datetime import datetime
 import argparse
 from pathlib import Path
 import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from config import DB_PARAMS, COUNTRY_SETTINGS, LOG_DIR, LOG_FORMAT
 from extractors import extractor_registry
@@ -43,8 +44,7 @@ def run_extraction_with_monitoring(country, force=False, refresh_days=30):
     
     try:
         # Get initial count
-        monitor.cur.execute("SELECT COUNT(*) FROM institutions WHERE country = %s", (country,))
-        initial_count = monitor.cur.fetchone()[0]
+        initial_count = monitor.count_institutions(country)
         logger.info(f"📊 Initial count for {country}: {initial_count:,} institutions")
         
         # Run extraction
@@ -59,8 +59,7 @@ def run_extraction_with_monitoring(country, force=False, refresh_days=30):
             extractor.run(force=force, refresh_days=refresh_days)
             
             # Post-extraction report
-            monitor.cur.execute("SELECT COUNT(*) FROM institutions WHERE country = %s", (country,))
-            final_count = monitor.cur.fetchone()[0]
+            final_count = monitor.count_institutions(country)
             
             new_records = final_count - initial_count
             duration = time.time() - start_time
@@ -103,6 +102,10 @@ def run_extraction_with_monitoring(country, force=False, refresh_days=30):
     finally:
         monitor.close()
 
+def _init_worker_logging(log_level):
+    """Give spawned workers console logging; forked workers inherit the parent's handlers"""
+    logging.basicConfig(level=log_level, format=LOG_FORMAT, handlers=[logging.StreamHandler(sys.stdout)])
+
 def run_batch_extraction(countries, force=False, refresh_days=30, max_parallel=1):
     """Run extraction for multiple countries with summary reporting"""
     logger = logging.getLogger(__name__)
@@ -112,18 +115,43 @@ def run_batch_extraction(countries, force=False, refresh_days=30, max_parallel=1
     
     logger.info(f"🌍 Starting batch extraction for countries: {', '.join(countries)}")
     
-    for i, country in enumerate(countries, 1):
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing {i}/{len(countries)}: {country}")
-        logger.info(f"{'='*60}")
-        
-        result = run_extraction_with_monitoring(country, force, refresh_days)
-        results.append(result)
-        
-        # Brief pause between countries to be respectful to servers
-        if i < len(countries):
-            logger.info("⏸️  Pausing between countries...")
-            time.sleep(2)
+    if max_parallel > 1 and len(countries) > 1:
+        # Countries hit disjoint sources and each extractor owns its DB connection,
+        # so run them in separate processes
+        logger.info(f"Running up to {max_parallel} countries in parallel")
+        with ProcessPoolExecutor(
+            max_workers=min(max_parallel, len(countries)),
+            initializer=_init_worker_logging,
+            initargs=(logging.getLogger().level,)
+        ) as executor:
+            futures = {
+                executor.submit(run_extraction_with_monitoring, country, force, refresh_days): country
+                for country in countries
+            }
+            for future in as_completed(futures):
+                country = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"💥 Extraction worker failed for {country}: {e}")
+                    result = {'country': country, 'success': False, 'error': str(e)}
+                logger.info(f"Finished {country} ({len(results) + 1}/{len(countries)})")
+                results.append(result)
+        # Report in the order the countries were requested
+        results.sort(key=lambda r: countries.index(r['country']))
+    else:
+        for i, country in enumerate(countries, 1):
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Processing {i}/{len(countries)}: {country}")
+            logger.info(f"{'='*60}")
+            
+            result = run_extraction_with_monitoring(country, force, refresh_days)
+            results.append(result)
+            
+            # Brief pause between countries to be respectful to servers
+            if i < len(countries):
+                logger.info("⏸️  Pausing between countries...")
+                time.sleep(2)
     
     # Final summary
     total_duration = time.time() - total_start_time
@@ -193,6 +221,8 @@ Examples:
                        help="Generate report without running extraction")
     parser.add_argument('--validate-coords', action='store_true',
                        help="Validate geographic coordinates")
+    parser.add_argument('--max-parallel', type=int, default=len(extractor_registry),
+                       help="Countries to extract concurrently; 1 runs them one after another (default: all)")
     
     args = parser.parse_args()
     
@@ -236,7 +266,8 @@ Examples:
         results = run_batch_extraction(
             countries, 
             force=args.force, 
-            refresh_days=args.refresh_days
+            refresh_days=args.refresh_days,
+            max_parallel=args.max_parallel
         )
         
         # Exit with error code if any extraction failed
@@ -90,31 +90,68 @@ def create_tables():
                 longitude DOUBLE PRECISION,
                 additional_attributes JSONB,
                 last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                search_vector TSVECTOR
+                search_vector TSVECTOR GENERATED ALWAYS AS (
+                    to_tsvector('english', COALESCE(name, '') || ' ' || COALESCE(country, ''))
+                ) STORED
             )
         """)
         
+        # Migrate tables from before search_vector was a generated column: the per-row
+        # plpgsql trigger that used to fill it goes, and the column is recomputed in place
+        cur.execute("""
+            DROP TRIGGER IF EXISTS trg_update_search_vector ON institutions;
+            DROP FUNCTION IF EXISTS update_search_vector();
+            DO $$ BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = 'institutions' AND column_name = 'search_vector' AND is_generated = 'NEVER'
+                ) THEN
+                    ALTER TABLE institutions DROP COLUMN search_vector;
+                    ALTER TABLE institutions ADD COLUMN search_vector TSVECTOR GENERATED ALWAYS AS (
+                        to_tsvector('english', COALESCE(name, '') || ' ' || COALESCE(country, ''))
+                    ) STORED;
+                END IF;
+            END $$;
+        """)
+        
         # Create indexes
         cur.execute("CREATE INDEX IF NOT EXISTS idx_country ON institutions(country)")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_name ON institutions(name)")
+        # Covers the monitors' per-country/type counts and MAX(last_updated) as index-only scans
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_country_type_updated ON institutions(country, type, last_updated)")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_search_vector ON institutions USING GIN(search_vector)")
         
-        # Create trigger function
+        # Statement-level change notifications for the progress monitor: one NOTIFY per
+        # distinct (country, type) touched, however many rows a bulk load writes
         cur.execute("""
-            CREATE OR REPLACE FUNCTION update_search_vector() RETURNS TRIGGER AS $$
+            CREATE OR REPLACE FUNCTION notify_institutions_changed() RETURNS TRIGGER AS $$
             BEGIN
-                NEW.search_vector := to_tsvector('english', COALESCE(NEW.name, '') || ' ' || COALESCE(NEW.country, ''));
-                RETURN NEW;
+                IF TG_OP = 'DELETE' THEN
+                    PERFORM pg_notify('inst_changed', country || ':' || type)
+                    FROM (SELECT DISTINCT country, type::text FROM old_rows) changed;
+                ELSE
+                    PERFORM pg_notify('inst_changed', country || ':' || type)
+                    FROM (SELECT DISTINCT country, type::text FROM new_rows) changed;
+                END IF;
+                RETURN NULL;
             END;
             $$ LANGUAGE plpgsql;
         """)
-        
-        # Create trigger
         cur.execute("""
-            DROP TRIGGER IF EXISTS trg_update_search_vector ON institutions;
-            CREATE TRIGGER trg_update_search_vector
-            BEFORE INSERT OR UPDATE ON institutions
-            FOR EACH ROW EXECUTE FUNCTION update_search_vector();
+            DROP TRIGGER IF EXISTS trg_notify_insert ON institutions;
+            CREATE TRIGGER trg_notify_insert
+            AFTER INSERT ON institutions REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_institutions_changed();
+            
+            DROP TRIGGER IF EXISTS trg_notify_update ON institutions;
+            CREATE TRIGGER trg_notify_update
+            AFTER UPDATE ON institutions REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_institutions_changed();
+            
+            DROP TRIGGER IF EXISTS trg_notify_delete ON institutions;
+            CREATE TRIGGER trg_notify_delete
+            AFTER DELETE ON institutions REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_institutions_changed();
         """)
         
         conn.commit()
@@ -0,0 +1,79 @@
+"""
+Tests for the binary COPY encoder used by BaseExtractor.insert_to_db
+Byte layouts follow PostgreSQL's COPY BINARY format: big-endian int32 field
+lengths (-1 for NULL), float8 as IEEE 754, jsonb prefixed with version 1,
+timestamps as int64 microseconds since 2000-01-01
+"""
+
+import struct
+from datetime import datetime
+
+from config import InstitutionType
+from extractors.base import (
+    BaseExtractor,
+    InstitutionRecord,
+    _COPY_BINARY_HEADER,
+    _COPY_BINARY_TRAILER,
+    _COPY_COLUMNS,
+    _CopyStream,
+    _copy_binary_row,
+)
+
+NULL = b'\xff\xff\xff\xff'
+
+def test_header_and_trailer():
+    assert _COPY_BINARY_HEADER == b'PGCOPY\n\xff\r\n\x00' + b'\x00\x00\x00\x00' + b'\x00\x00\x00\x00'
+    assert _COPY_BINARY_TRAILER == b'\xff\xff'
+
+def test_row_bytes():
+    row = ('Mayo', 'hospital', 'USA', None, None, None, None, 1.5, None, '{"a": 1}', datetime(2000, 1, 1, 0, 0, 1))
+    assert len(row) == len(_COPY_COLUMNS)
+
+    expected = (
+        b'\x00\x0b'                                   # 11 fields
+        + b'\x00\x00\x00\x04Mayo'
+        + b'\x00\x00\x00\x08hospital'                 # enum label travels as text
+        + b'\x00\x00\x00\x03USA'
+        + NULL * 4                                    # state, city, address, website
+        + b'\x00\x00\x00\x08' + b'\x3f\xf8\x00\x00\x00\x00\x00\x00'  # latitude 1.5
+        + NULL                                        # longitude
+        + b'\x00\x00\x00\x09' + b'\x01' + b'{"a": 1}'  # jsonb version byte, then the text
+        + b'\x00\x00\x00\x08' + b'\x00\x00\x00\x00\x00\x0f\x42\x40'  # 1,000,000 us after the epoch
+    )
+    assert _copy_binary_row(row) == expected
+
+def test_text_length_counts_utf8_bytes():
+    row = ('é', 'clinic', 'USA') + (None,) * 8
+    assert _copy_binary_row(row)[2:8] == b'\x00\x00\x00\x02' + b'\xc3\xa9'
+
+def test_timestamp_before_epoch():
+    row = ('x', 'clinic', 'USA') + (None,) * 7 + (datetime(1999, 12, 31, 23, 59, 59, 500000),)
+    assert _copy_binary_row(row).endswith(b'\x00\x00\x00\x08' + struct.pack('>q', -500000))
+
+def test_rows_coerce_coordinates_and_skip_bad_records():
+    extractor = BaseExtractor.__new__(BaseExtractor)  # no DB or HTTP needed for serialization
+    extractor.country = 'USA'
+    now = datetime(2024, 1, 1)
+    data = [
+        InstitutionRecord(name='ok', type=InstitutionType.CLINIC, latitude='12.5', longitude=7),
+        InstitutionRecord(name='bad', type=InstitutionType.CLINIC, latitude='abc'),
+        InstitutionRecord(name='none', type=InstitutionType.CLINIC),
+    ]
+    rows = list(extractor._rows(data, now))
+    assert [row[0] for row in rows] == ['ok', 'none']
+    assert rows[0][7:9] == (12.5, 7.0) and type(rows[0][8]) is float
+    assert rows[1][7:9] == (None, None)
+    assert struct.pack('>id', 8, 12.5) + struct.pack('>id', 8, 7.0) in _copy_binary_row(rows[0])
+
+def test_stream_read_chunks_across_pieces():
+    stream = _CopyStream(iter([b'abc', b'de', b'fghij']))
+    assert stream.read(4) == b'abcd'
+    assert stream.read(4) == b'efgh'
+    assert stream.read(4) == b'ij'
+    assert stream.read(4) == b''
+
+def test_stream_read_all():
+    stream = _CopyStream(iter([b'abc', b'de']))
+    assert stream.read(1) == b'a'
+    assert stream.read() == b'bcde'
+    assert stream.read() == b''